@@ -11,14 +11,88 @@ Features:
 - Automatic confirmation reminders
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
-from datetime import datetime, timedelta
-import uuid
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator
+from typing import Iterable, Literal, Optional, List, Tuple, Union, get_args
+from datetime import date, datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from secrets import token_hex
+import re
 
 
-class AppointmentStatus(str, Enum):
+# Statuses and services are validated as Literal strings: pydantic-core checks
+# them against a prebuilt set instead of doing an Enum member lookup.
+AppointmentStatusValue = Literal[
+    "Scheduled", "Confirmed", "In Progress", "Completed",
+    "Cancelled", "No Show", "Rescheduled",
+]
+
+ServiceTypeValue = Literal[
+    "Consultation", "Cleaning", "Filling", "Root Canal", "Extraction",
+    "Orthodontics", "Whitening", "Implant", "Crown", "Emergency", "Other",
+]
+
+SERVICE_TYPES: Tuple[str, ...] = get_args(ServiceTypeValue)
+
+# Hot-path constants for the time predicates below
+_MINUTES_PER_DAY = 24 * 60
+_now = datetime.now
+
+
+# Canonical stored forms; ASCII digits only (plain \d also matches e.g. full-width digits)
+_DATE_FORMAT = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+_TIME_FORMAT = re.compile(r'\d{2}:\d{2}', re.ASCII)
+
+# Mirrors the Field() length limits below; re-checked by from_trusted_dict
+_TRUSTED_LENGTH_CHECKS = (
+    ("patient_name", 1, 100),
+    ("patient_phone", 7, 20),
+    ("doctor_name", 1, 100),
+)
+
+
+def _parse_date(v: str) -> date:
+    """Validate an appointment date (YYYY-MM-DD, not in the past)."""
+    try:
+        # date.fromisoformat is C-implemented and skips strptime's locale work;
+        # it also takes forms like "20251215" or "2025-W01-1", so the shape is
+        # checked first. Unlike "%Y-%m-%d", month and day must be zero-padded.
+        if not _DATE_FORMAT.fullmatch(v):
+            raise ValueError(f"invalid date string '{v}'")
+        date_obj = date.fromisoformat(v)
+        # Appointments must be at least 1 hour in the future
+        if date_obj < date.today():
+            raise ValueError('Appointment date must be in the future')
+        return date_obj
+    except ValueError as e:
+        raise ValueError(f'Date must be in YYYY-MM-DD format. Error: {str(e)}')
+
+
+def _parse_time(v: str) -> Tuple[int, int]:
+    """Validate an appointment time (HH:MM within business hours)."""
+    try:
+        # Parse HH:MM by hand instead of going through strptime (zero-padded)
+        if not _TIME_FORMAT.fullmatch(v):
+            raise ValueError(f"invalid time string '{v}'")
+        hour = int(v[:2])
+        minute = int(v[3:])
+        if minute >= 60:
+            raise ValueError(f"invalid minute in '{v}'")
+        # Ensure time is during business hours (08:00 - 20:00)
+        if hour < 8 or hour >= 20:
+            raise ValueError('Appointments must be scheduled between 08:00 and 20:00')
+        return hour, minute
+    except ValueError as e:
+        raise ValueError(f'Time must be in HH:MM format (08:00-20:00). Error: {str(e)}')
+
+
+def _now_stamp() -> int:
+    """Current local time in the same packed-minute form."""
+    now = _now()
+    return now.toordinal() * _MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+
+class AppointmentStatus:
     """Possible states of an appointment."""
     SCHEDULED = "Scheduled"
     CONFIRMED = "Confirmed"
@@ -29,7 +103,7 @@ class AppointmentStatus(str, Enum):
     RESCHEDULED = "Rescheduled"
 
 
-class ServiceType(str, Enum):
+class ServiceType:
     """Types of dental services available."""
     CONSULTATION = "Consultation"
     CLEANING = "Cleaning"
@@ -44,6 +118,13 @@ class ServiceType(str, Enum):
     OTHER = "Other"
 
 
+# Statuses from which an appointment can no longer be cancelled
+_CANCEL_BLOCKED = frozenset({AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED})
+
+# Statuses of appointments that are still ahead and can be cancelled or rescheduled
+ACTIVE_STATUSES = (AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED)
+
+
 class Appointment(BaseModel):
     """
     Appointment model representing a scheduled dental visit.
@@ -62,71 +143,100 @@ class Appointment(BaseModel):
         reminder_sent: Whether reminder notification was sent
         duration_minutes: Expected duration of appointment
     """
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:8], alias="_id")
+    id: str = Field(default_factory=lambda: token_hex(4), alias="_id")
     patient_name: str = Field(..., min_length=1, max_length=100)
     patient_phone: str = Field(..., min_length=7, max_length=20)
     doctor_name: str = Field(..., min_length=1, max_length=100)
     date: str = Field(..., description="Format: YYYY-MM-DD")
     time: str = Field(..., description="Format: HH:MM")
-    service_type: ServiceType = Field(default=ServiceType.CONSULTATION)
-    status: AppointmentStatus = Field(default=AppointmentStatus.SCHEDULED)
+    service_type: ServiceTypeValue = Field(default=ServiceType.CONSULTATION)
+    status: AppointmentStatusValue = Field(default=AppointmentStatus.SCHEDULED)
     notes: Optional[str] = Field(default=None, max_length=500)
     created_at: datetime = Field(default_factory=datetime.now)
     reminder_sent: bool = Field(default=False)
     duration_minutes: int = Field(default=30, ge=15, le=180)
     cancellation_reason: Optional[str] = Field(default=None, max_length=200)
 
-    class Config:
-        """Pydantic configuration."""
-        populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    # (date, time) that _dt and _minute_stamp were computed from. Caches are
+    # filled on first use and rebuilt whenever it no longer matches, so
+    # assignment, model_copy(update=...) and model_construct can never leave
+    # them describing an old slot.
+    _schedule_key: Optional[Tuple[str, str]] = PrivateAttr(default=None)
+    # Parsed date + time
+    _dt: Optional[datetime] = PrivateAttr(default=None)
+    # date + time packed as minutes since 0001-01-01, used by the time predicates
+    _minute_stamp: int = PrivateAttr(default=0)
+
+    model_config = ConfigDict(populate_by_name=True)
 
     @field_validator('date')
     @classmethod
     def validate_date(cls, v):
         """Validate date format and ensure it's in the future."""
-        try:
-            date_obj = datetime.strptime(v, "%Y-%m-%d")
-            # Appointments must be at least 1 hour in the future
-            if date_obj.date() < datetime.now().date():
-                raise ValueError('Appointment date must be in the future')
-            return v
-        except ValueError as e:
-            raise ValueError(f'Date must be in YYYY-MM-DD format. Error: {str(e)}')
+        _parse_date(v)
+        return v
 
     @field_validator('time')
     @classmethod
     def validate_time(cls, v):
         """Validate time format."""
-        try:
-            datetime.strptime(v, "%H:%M")
-            # Ensure time is during business hours (08:00 - 20:00)
-            hour = int(v.split(':')[0])
-            if hour < 8 or hour >= 20:
-                raise ValueError('Appointments must be scheduled between 08:00 and 20:00')
-            return v
-        except ValueError as e:
-            raise ValueError(f'Time must be in HH:MM format (08:00-20:00). Error: {str(e)}')
+        _parse_time(v)
+        return v
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "Appointment":
+        """Build an appointment from a JSON document in a single parse pass."""
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def from_trusted_dict(cls, raw: dict) -> "Appointment":
+        """
+        Build an appointment from an already-validated document (e.g. a DB read).
+
+        Only the cheap length checks are repeated; pydantic's generic
+        validation is skipped through model_construct.
+        """
+        for key, min_len, max_len in _TRUSTED_LENGTH_CHECKS:
+            value = raw.get(key)
+            if value is None or not (min_len <= len(value) <= max_len):
+                raise ValueError(f"{key} must be {min_len}-{max_len} characters")
+        # model_construct skips validators; the caches fill on first use
+        return cls.model_construct(**raw)
+
+    def _refresh_schedule(self) -> None:
+        """Recompute the cached datetime/stamp if date or time changed since."""
+        key = (self.date, self.time)
+        if self._schedule_key != key:
+            # Parse before touching the caches, so a bad value leaves them consistent
+            dt = datetime.fromisoformat(self.date + "T" + self.time)
+            self._dt = dt
+            self._minute_stamp = dt.toordinal() * _MINUTES_PER_DAY + dt.hour * 60 + dt.minute
+            self._schedule_key = key
+
+    def _stamp(self) -> int:
+        """Packed minute stamp for the current date and time."""
+        self._refresh_schedule()
+        return self._minute_stamp
 
     def get_datetime(self) -> datetime:
-        """Return combined datetime object."""
-        return datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
+        """Return combined datetime object (parsed once per date/time, then cached)."""
+        self._refresh_schedule()
+        return self._dt
 
     def is_upcoming(self) -> bool:
-        """Check if appointment is in the future."""
-        return self.get_datetime() > datetime.now()
+        """Check if appointment is in the future (minute resolution)."""
+        return self._stamp() > _now_stamp()
 
     def is_overdue(self) -> bool:
         """Check if appointment time has passed without completion."""
         if self.status == AppointmentStatus.COMPLETED:
             return False
-        return self.get_datetime() < datetime.now()
+        return self._stamp() < _now_stamp()
 
     def remind_soon(self) -> bool:
         """Check if appointment is within 24 hours."""
-        appointment_time = self.get_datetime()
-        time_until_appointment = appointment_time - datetime.now()
-        return timedelta(0) < time_until_appointment <= timedelta(hours=24)
+        minutes_until_appointment = self._stamp() - _now_stamp()
+        return 0 < minutes_until_appointment <= _MINUTES_PER_DAY
 
     def confirm(self) -> None:
         """Confirm the appointment."""
@@ -135,7 +245,7 @@ class Appointment(BaseModel):
 
     def cancel(self, reason: str = "No reason provided") -> None:
         """Cancel the appointment with optional reason."""
-        if self.status not in [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]:
+        if self.status not in _CANCEL_BLOCKED:
             self.status = AppointmentStatus.CANCELLED
             self.cancellation_reason = reason
 
@@ -146,9 +256,68 @@ class Appointment(BaseModel):
 
     def __str__(self) -> str:
         """String representation."""
-        return (f"Appointment: {self.patient_name} with Dr. {self.doctor_name} "
-                f"on {self.date} at {self.time} ({self.status})")
+        return "".join((
+            "Appointment: ", self.patient_name, " with Dr. ", self.doctor_name,
+            " on ", self.date, " at ", self.time, " (", self.status, ")",
+        ))
 
     def __repr__(self) -> str:
         """Developer representation."""
         return f"Appointment({self.id})"
+
+
+# Small integer codes for the status column of AppointmentTable
+_STATUS_CODES = {status: code for code, status in enumerate(get_args(AppointmentStatusValue))}
+_COMPLETED_CODE = _STATUS_CODES[AppointmentStatus.COMPLETED]
+
+
+class AppointmentTable:
+    """
+    Column-oriented snapshot of many appointments for bulk time scans.
+
+    Packed minute stamps, status codes and reminder flags are kept in
+    contiguous arrays, sorted by minute stamp. Dashboard queries such as
+    "which appointments are overdue" bisect the stamp column to the relevant
+    window and only compare plain integers inside it.
+    The table is a snapshot: rebuild it after mutating the appointments.
+    """
+
+    def __init__(self, appointments: Iterable[Appointment]):
+        self.appointments: List[Appointment] = sorted(appointments, key=Appointment._stamp)
+        self.minute_stamps = array('q', (a._stamp() for a in self.appointments))
+        self.statuses = array('b', (_STATUS_CODES[a.status] for a in self.appointments))
+        self.reminders_sent = array('b', (a.reminder_sent for a in self.appointments))
+
+    def __len__(self) -> int:
+        return len(self.appointments)
+
+    def overdue(self) -> List[Appointment]:
+        """Appointments whose time has passed without being completed."""
+        end = bisect_left(self.minute_stamps, _now_stamp())
+        statuses = self.statuses
+        return [self.appointments[i] for i in range(end) if statuses[i] != _COMPLETED_CODE]
+
+    def due_for_reminder(self) -> List[Appointment]:
+        """Appointments within the next 24 hours that have not been reminded yet."""
+        now = _now_stamp()
+        start = bisect_right(self.minute_stamps, now)
+        end = bisect_right(self.minute_stamps, now + _MINUTES_PER_DAY, lo=start)
+        sent = self.reminders_sent
+        return [self.appointments[i] for i in range(start, end) if not sent[i]]
+
+
+# Bound once so bulk JSON loaders skip the per-call attribute lookups
+validate_appointment_json = Appointment.__pydantic_validator__.validate_json
+
+# Built once at import; constructing a TypeAdapter per call rebuilds its validator
+APPOINTMENT_LIST_ADAPTER = TypeAdapter(List[Appointment])
+
+
+def dump_many(appointments: List[Appointment]) -> bytes:
+    """Serialize a list of appointments to JSON bytes."""
+    return APPOINTMENT_LIST_ADAPTER.dump_json(appointments)
+
+
+def load_many(raw: Union[str, bytes]) -> List[Appointment]:
+    """Validate a JSON array of appointments in a single parse pass."""
+    return APPOINTMENT_LIST_ADAPTER.validate_json(raw)
@@ -9,14 +9,233 @@ Intelligent conversational AI for appointment booking with:
 """
 
 from src.services.clinic_service import ClinicService
-from src.models.appointment import Appointment, AppointmentStatus, ServiceType
-from typing import Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from src.models.appointment import Appointment, AppointmentStatus, SERVICE_TYPES
+from typing import List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+import heapq
 import re
-
-
-class ConversationState:
-    """Conversation stage constants."""
+import time
+
+
+# Compiled once at import instead of on every validation call. Like strptime's
+# "%Y-%m-%d"/"%H:%M", month, day and hour may be given without a leading zero;
+# answers are zero-padded before they reach the Appointment model.
+_PHONE_RE = re.compile(r'^[\d\s\-\+\(\)]{7,20}$')
+_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$', re.ASCII)
+_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$', re.ASCII)
+
+# Lowercase input is split into word tokens once; keyword checks are set/dict lookups
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Intent keywords, matched as whole words (or two-word phrases). Add synonyms
+# here; lookup cost stays one dict probe per input word however long this gets.
+# When several intents appear, _INTENT_PRIORITY decides (cancel wins over book).
+_INTENT_KEYWORDS = {
+    "cancel": ("cancel", "delete", "remove", "stop"),
+    "reschedule": ("reschedule", "change", "modify", "update", "move"),
+    "view": ("view", "see", "show", "list", "check", "my", "upcoming", "appointments"),
+    "book": ("book", "schedule", "appointment", "make", "new", "create", "set up"),
+}
+_INTENT_PRIORITY = ("cancel", "reschedule", "view", "book")
+_INTENT_BY_WORD = {
+    keyword: intent
+    for intent, keywords in _INTENT_KEYWORDS.items()
+    for keyword in keywords if " " not in keyword
+}
+_INTENT_BY_PHRASE = {
+    tuple(keyword.split()): intent
+    for intent, keywords in _INTENT_KEYWORDS.items()
+    for keyword in keywords if " " in keyword
+}
+
+# Trigger words for the problem/follow-up handlers, compared against the
+# input's word tokens (common inflections listed explicitly).
+_URGENT_WORDS = frozenset({"emergency", "urgent", "urgently", "severe", "severely", "pain", "painful"})
+_ROUTINE_WORDS = frozenset({"clean", "cleaning", "routine", "checkup", "checkups"})
+_COSMETIC_WORDS = frozenset({"cosmetic", "whiten", "whitening", "brighten", "brightening"})
+_FAREWELL_WORDS = frozenset({"thank", "thanks", "bye", "goodbye"})
+
+# Answers to the "What would you like to do?" menu
+_INTENT_CHOICE = {
+    "1": "book", "book": "book", "booking": "book", "schedule": "book", "appointment": "book",
+    "2": "cancel", "cancel": "cancel", "cancellation": "cancel",
+    "3": "reschedule", "reschedule": "reschedule", "change": "reschedule",
+    "4": "view", "view": "view", "see": "view", "show": "view",
+}
+
+# yes/no answers to the booking and reschedule confirmations
+_YES_WORDS = frozenset({"yes", "y", "ok", "correct", "sure"})
+_CONFIRM_NO_WORDS = frozenset({"no", "n", "cancel", "edit"})
+_NO_WORDS = frozenset({"no", "n", "cancel"})
+
+# Answers to "book, cancel, or reschedule any of these?" after viewing appointments
+_BOOK_WORDS = frozenset({"book", "booking", "new", "schedule"})
+_CANCEL_WORDS = frozenset({"cancel", "cancellation"})
+_RESCHEDULE_WORDS = frozenset({"reschedule", "change"})
+_EXIT_WORDS = frozenset({"no", "nothing", "thanks", "bye"})
+
+# Shown next to each appointment in the "view my appointments" list
+_STATUS_EMOJI = {
+    AppointmentStatus.SCHEDULED: "📅",
+    AppointmentStatus.CONFIRMED: "✅",
+    AppointmentStatus.COMPLETED: "✔️",
+    AppointmentStatus.CANCELLED: "❌",
+    AppointmentStatus.NO_SHOW: "🚫",
+    AppointmentStatus.RESCHEDULED: "🔄",
+}
+
+# Global commands that abandon the conversation from any state
+_QUIT_WORDS = frozenset({"cancel", "exit", "quit"})
+
+# Sessions expire this long after they were created
+_SESSION_TTL_SECONDS = 3600
+# Expired sessions are evicted every N turns
+_EVICT_EVERY_TURNS = 10
+# Least recently active sessions are dropped beyond this many
+_MAX_SESSIONS = 10000
+# How long the doctor list/menu is reused before asking the clinic again
+_DOCTORS_CACHE_TTL_SECONDS = 60
+
+# Replies that never change
+_CONVERSATION_CANCELLED_MSG = "Conversation cancelled. Type anything to start over!"
+_UNKNOWN_STATE_MSG = "I'm not sure what to do. Type 'restart' to begin again."
+_INVALID_PHONE_MSG = (
+    "[ERROR] Please provide a valid phone number (7-20 digits)\n\n"
+    "Example: +1-555-123-4567"
+)
+_BOOKING_CANCELLED_MSG = (
+    "[CANCEL] Appointment cancelled.\n\n"
+    "Type anything to start over."
+)
+_YES_NO_PROMPT_MSG = "[ERROR] Please answer with 'yes' or 'no'"
+_FOLLOWUP_PROMPT_MSG = (
+    "[INFO] Is there anything else I can help you with?\n"
+    "Type 'restart' to book another appointment or 'bye' to exit."
+)
+_INTENT_MENU_MSG = (
+    "Hello! I'm your dental clinic assistant.\n\n"
+    "What would you like to do?\n\n"
+    "1. 📅 Book a new appointment\n"
+    "2. ❌ Cancel an existing appointment\n"
+    "3. 🔄 Reschedule an appointment\n"
+    "4. 👀 View my appointments\n\n"
+    "Please type the number or describe what you need:"
+)
+_INTENT_MENU_RETRY_MSG = (
+    "[ERROR] I didn't understand that option.\n\n"
+    "Please choose:\n"
+    "1. Book appointment\n"
+    "2. Cancel appointment\n"
+    "3. Reschedule appointment\n"
+    "4. View appointments"
+)
+_CANCEL_START_MSG = (
+    "[CANCEL] Let's cancel your appointment.\n\n"
+    "Please provide your name or phone number to find your appointments:"
+)
+_CANCEL_FAILED_MSG = "[ERROR] Failed to cancel appointment. Please try again or contact support."
+_INVALID_NUMBER_MSG = "[ERROR] Please enter a valid number."
+_RESCHEDULE_START_MSG = (
+    "[RESCHEDULE] Let's reschedule your appointment.\n\n"
+    "Please provide your name or phone number to find your appointments:"
+)
+_RESCHEDULE_FAILED_MSG = "[ERROR] Failed to reschedule appointment. Please try again or contact support."
+_RESCHEDULE_CANCELLED_MSG = (
+    "[CANCEL] Rescheduling cancelled.\n\n"
+    "Type anything to start over."
+)
+_VIEW_START_MSG = (
+    "[VIEW] Let's check your appointments.\n\n"
+    "Please provide your name or phone number:"
+)
+_VIEW_FOLLOWUP_PROMPT_MSG = (
+    "[INFO] What would you like to do next?\n"
+    "Type 'book' for new appointment, 'cancel' to cancel, 'reschedule' to change, or 'no' to exit."
+)
+_FAREWELL_MSG = "[END] You're welcome! Have a great day and take care of your smile!"
+
+_GREETING_TEMPLATE = (
+    "{greeting}, {name}!\n\n"
+    "Welcome to DentalClinic Pro - Your appointment assistant.\n"
+    "I'm here to help you book an appointment quickly and easily.\n"
+    "(Type 'cancel' anytime to exit)"
+)
+
+
+@lru_cache(maxsize=24)
+def _greeting_for_hour(hour: int) -> str:
+    """Return the time-of-day salutation for an hour (0-23)."""
+    if hour < 12:
+        return "Good morning"
+    if hour < 18:
+        return "Good afternoon"
+    return "Good evening"
+
+
+# Date/time answers repeat a lot across sessions, so validation results are memoized.
+# Dates are keyed with "today" too, so cached answers roll over at midnight.
+_INVALID_DATE = (False, "Invalid date format. Please use YYYY-MM-DD (e.g., 2025-12-25)")
+_INVALID_TIME = (False, "Invalid time format. Please use HH:MM (e.g., 14:30)")
+
+
+@lru_cache(maxsize=512)
+def _check_date(date_str: str, today: date) -> Tuple[bool, Optional[str]]:
+    """Validate a stripped YYYY-MM-DD string against today's booking window."""
+    match = _DATE_RE.match(date_str)
+    if not match:
+        return _INVALID_DATE
+    try:
+        date_obj = date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return _INVALID_DATE
+
+    # Appointments must be at least 1 day in the future
+    if date_obj < today:
+        return False, "Date must be in the future"
+    # Can't book more than 90 days ahead
+    if date_obj > today + timedelta(days=90):
+        return False, "Cannot book appointments more than 3 months in advance"
+    return True, None
+
+
+@lru_cache(maxsize=512)
+def _check_time(time_str: str) -> Tuple[bool, Optional[str]]:
+    """Validate a stripped HH:MM string against business hours and slots."""
+    match = _TIME_RE.match(time_str)
+    if not match:
+        return _INVALID_TIME
+    hour = int(match[1])
+    minute = int(match[2])
+
+    # Business hours: 08:00 - 20:00
+    if hour < 8 or hour >= 20:
+        return False, "Clinic hours are 08:00 to 20:00"
+
+    # Check for 30-minute intervals only
+    if minute not in (0, 30):
+        return False, "Please select time on 30-minute intervals (e.g., 14:00 or 14:30)"
+
+    return True, None
+
+
+def _canonical_date(date_str: str) -> str:
+    """Zero-pad a validated date answer to the model's YYYY-MM-DD form."""
+    year, month, day = _DATE_RE.match(date_str).groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def _canonical_time(time_str: str) -> str:
+    """Zero-pad a validated time answer (e.g. "8:30") to the model's HH:MM form."""
+    hour, minute = _TIME_RE.match(time_str).groups()
+    return f"{int(hour):02d}:{minute}"
+
+
+class ConversationState(str, Enum):
+    """Conversation stages; members compare equal to their string values."""
     START = "start"
     GREETING = "greeting"
     PROBLEM_ASSESSMENT = "problem_assessment"
@@ -41,6 +260,38 @@ class ConversationState:
     VIEW_RESULTS = "view_results"
 
 
+@dataclass(slots=True)
+class SessionData:
+    """Appointment details collected during a conversation."""
+    patient_name: str
+    problem: Optional[str] = None
+    service_type: Optional[str] = None
+    date: Optional[str] = None
+    time: Optional[str] = None
+    doctor_name: Optional[str] = None
+    phone: Optional[str] = None
+    notes: Optional[str] = None
+    # Cancel/reschedule flows
+    available_appointments: List[Appointment] = field(default_factory=list)
+    selected_appointment: Optional[Appointment] = None
+    new_date: Optional[str] = None
+    new_time: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Session:
+    """Conversation state for one user."""
+    state: ConversationState
+    user_name: str
+    data: SessionData
+    created_at: datetime
+    expires_at: float
+    # Clock reading for the current turn, refreshed by get_response
+    now: datetime
+    validation_errors: List[str] = field(default_factory=list)
+    attempt_count: int = 0
+
+
 class ChatBotService:
     """
     Professional dental clinic chatbot.
@@ -49,89 +300,104 @@ class ChatBotService:
     validates inputs, and books appointments in MongoDB.
     """
 
+    # Services, their lookups and menus never change, so build them once per class
+    _AVAILABLE_SERVICES: Tuple[str, ...] = SERVICE_TYPES
+    available_services = _AVAILABLE_SERVICES
+    _SERVICES_LOWER = tuple(s.lower() for s in SERVICE_TYPES)
+    _SERVICE_LOOKUP = {s.lower(): s for s in SERVICE_TYPES}
+    _SERVICES_MENU_TEXT = (
+        "What service would you like?\n"
+        + "".join(f"  {i}. {service}\n" for i, service in enumerate(SERVICE_TYPES[:6], 1))
+        + f"  ... ({len(SERVICE_TYPES)} services available)\n"
+        + "\nOr type the service name directly:"
+    )
+    _SERVICES_LIST_TEXT = "\n".join(f"  - {s}" for s in SERVICE_TYPES)
+
     def __init__(self):
         """Initialize chatbot with clinic service access."""
         self.clinic = ClinicService()
-        self.sessions: Dict[str, dict] = {}
-        self.available_services = [s.value for s in ServiceType]
-
-    def _create_session(self, user_name: str) -> dict:
-        """Create new conversation session for a user."""
-        return {
-            "state": ConversationState.START,
-            "user_name": user_name,
-            "data": {
-                "patient_name": user_name,
-                "problem": None,
-                "service_type": None,
-                "date": None,
-                "time": None,
-                "doctor_name": None,
-                "phone": None,
-                "notes": None
-            },
-            "validation_errors": [],
-            "attempt_count": 0,
-            "created_at": datetime.now()
+        # Ordered by last activity, so the least recent session is first
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        # (expires_at timestamp, user_name), popped in expiry order
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._turn_count = 0
+        # (fetched_at monotonic time, doctors, rendered doctor menu)
+        self._doctors_cache: Optional[Tuple[float, list, str]] = None
+        # State -> handler for the user's next message (START is routed in get_response)
+        # Each is called as handler(session, user_input, user_input_lower) with the input already stripped
+        self._handlers = {
+            ConversationState.INTENT_DETECTION: self._handle_intent_detection_response,
+            ConversationState.GREETING: self._handle_problem_assessment,
+            ConversationState.PROBLEM_ASSESSMENT: self._handle_service_selection,
+            ConversationState.SERVICE_SELECTION: self._handle_date_selection,
+            ConversationState.DATE_SELECTION: self._handle_time_selection,
+            ConversationState.TIME_SELECTION: self._handle_phone_collection,
+            ConversationState.PHONE_COLLECTION: self._handle_doctor_selection,
+            ConversationState.DOCTOR_SELECTION: self._handle_confirmation,
+            ConversationState.CONFIRMATION: self._handle_confirmation,
+            ConversationState.BOOKING_COMPLETE: self._handle_followup,
+            ConversationState.CANCEL_START: self._handle_cancel_appointment_selection,
+            ConversationState.CANCEL_CONFIRMATION: self._handle_cancel_confirmation,
+            ConversationState.RESCHEDULE_START: self._handle_reschedule_appointment_selection,
+            ConversationState.RESCHEDULE_APPOINTMENT_SELECTION: self._handle_reschedule_appointment_selection_response,
+            ConversationState.RESCHEDULE_DATE_SELECTION: self._handle_reschedule_date_selection,
+            ConversationState.RESCHEDULE_TIME_SELECTION: self._handle_reschedule_time_selection,
+            ConversationState.RESCHEDULE_CONFIRMATION: self._handle_reschedule_confirmation,
+            ConversationState.VIEW_START: self._handle_view_appointments,
+            ConversationState.VIEW_RESULTS: self._handle_view_followup,
         }
+        # Answer keyword -> next step after viewing appointments
+        self._view_followup_handlers = {word: self._handle_greeting for word in _BOOK_WORDS}
+        self._view_followup_handlers.update((word, self._handle_cancel_start) for word in _CANCEL_WORDS)
+        self._view_followup_handlers.update((word, self._handle_reschedule_start) for word in _RESCHEDULE_WORDS)
+        self._view_followup_handlers.update((word, self._handle_view_exit) for word in _EXIT_WORDS)
+
+    def _create_session(self, user_name: str, now: Optional[datetime] = None) -> Session:
+        """Create new conversation session for a user and schedule its expiry."""
+        now = now or datetime.now()
+        expires_at = now.timestamp() + _SESSION_TTL_SECONDS
+        heapq.heappush(self._expiry_heap, (expires_at, user_name))
+        return Session(
+            state=ConversationState.START,
+            user_name=user_name,
+            data=SessionData(patient_name=user_name),
+            created_at=now,
+            expires_at=expires_at,
+            now=now,
+        )
 
-    def _get_or_create_session(self, user_name: str) -> dict:
-        """Get existing session or create new one."""
-        if user_name not in self.sessions:
-            self.sessions[user_name] = self._create_session(user_name)
-        return self.sessions[user_name]
+    def _get_or_create_session(self, user_name: str, now: Optional[datetime] = None) -> Session:
+        """Get existing session or create new one, keeping LRU order."""
+        session = self.sessions.get(user_name)
+        if session is None:
+            session = self.sessions[user_name] = self._create_session(user_name, now)
+            if len(self.sessions) > _MAX_SESSIONS:
+                self.sessions.popitem(last=False)
+        else:
+            self.sessions.move_to_end(user_name)
+        return session
 
     def _is_valid_phone(self, phone: str) -> bool:
         """Validate phone number format."""
-        pattern = r'^[\d\s\-\+\(\)]{7,20}$'
-        return bool(re.match(pattern, phone.strip()))
+        return _PHONE_RE.match(phone.strip()) is not None
 
-    def _is_valid_date(self, date_str: str) -> Tuple[bool, Optional[str]]:
-        """Validate date format and ensure it's in the future."""
-        try:
-            date_obj = datetime.strptime(date_str.strip(), "%Y-%m-%d")
-            # Appointments must be at least 1 day in the future
-            if date_obj.date() < datetime.now().date():
-                return False, "Date must be in the future"
-            # Can't book more than 90 days ahead
-            if date_obj.date() > datetime.now().date() + timedelta(days=90):
-                return False, "Cannot book appointments more than 3 months in advance"
-            return True, None
-        except ValueError:
-            return False, "Invalid date format. Please use YYYY-MM-DD (e.g., 2025-12-25)"
+    def _is_valid_date(self, date_str: str, today: Optional[date] = None) -> Tuple[bool, Optional[str]]:
+        """Validate date format and ensure it's in the future (relative to today)."""
+        return _check_date(date_str.strip(), today or date.today())
 
     def _is_valid_time(self, time_str: str) -> Tuple[bool, Optional[str]]:
         """Validate time format and business hours."""
-        try:
-            time_obj = datetime.strptime(time_str.strip(), "%H:%M")
-            hour = time_obj.hour
-            minute = time_obj.minute
-            
-            # Business hours: 08:00 - 20:00
-            if hour < 8 or hour >= 20:
-                return False, "Clinic hours are 08:00 to 20:00"
-            
-            # Check for 30-minute intervals only
-            if minute not in [0, 30]:
-                return False, "Please select time on 30-minute intervals (e.g., 14:00 or 14:30)"
-            
-            return True, None
-        except ValueError:
-            return False, "Invalid time format. Please use HH:MM (e.g., 14:30)"
-
-    def _cleanup_old_sessions(self, max_age_hours: int = 1):
-        """Remove sessions older than max_age_hours."""
-        now = datetime.now()
-        expired_users = []
-        
-        for user_name, session in self.sessions.items():
-            created = session.get("created_at", now)
-            age = (now - created).total_seconds() / 3600
-            if age > max_age_hours:
-                expired_users.append(user_name)
-        
-        for user_name in expired_users:
-            del self.sessions[user_name]
+        return _check_time(time_str.strip())
+
+    def _evict_expired(self, now_ts: float):
+        """Drop sessions whose expiry time has passed, oldest first."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now_ts:
+            expires_at, user_name = heapq.heappop(heap)
+            session = self.sessions.get(user_name)
+            # Skip stale entries left behind when a session was recreated
+            if session is not None and session.expires_at == expires_at:
+                del self.sessions[user_name]
 
     def get_response(self, user_input: str, user_name: str = "Guest") -> str:
         """
@@ -139,26 +405,33 @@ class ChatBotService:
 
         Implements state machine for multi-turn appointment booking and management.
         """
-        # Cleanup old sessions every 10 interactions
-        if len(self.sessions) % 10 == 0:
-            self._cleanup_old_sessions()
+        # One clock reading per turn, shared by every handler below
+        now = datetime.now()
+
+        # Evict expired sessions every few interactions
+        self._turn_count += 1
+        if self._turn_count % _EVICT_EVERY_TURNS == 0:
+            self._evict_expired(now.timestamp())
 
-        session = self._get_or_create_session(user_name)
-        state = session["state"]
+        session = self._get_or_create_session(user_name, now)
+        session.now = now
+        state = session.state
+        # Strip and lowercase once; handlers receive both forms and must not redo it
         user_input = user_input.strip()
+        user_input_lower = user_input.lower()
 
         # Handle global commands
-        if user_input.lower() in ["cancel", "exit", "quit"]:
-            session["state"] = ConversationState.START
-            return "Conversation cancelled. Type anything to start over!"
+        if user_input_lower in _QUIT_WORDS:
+            session.state = ConversationState.START
+            return _CONVERSATION_CANCELLED_MSG
 
-        if user_input.lower() == "restart":
-            self.sessions[user_name] = self._create_session(user_name)
+        if user_input_lower == "restart":
+            self.sessions[user_name] = self._create_session(user_name, now)
             return self._handle_greeting(self.sessions[user_name])
 
         # Detect intent at START state
-        if state == ConversationState.START:
-            intent = self._detect_intent(user_input)
+        if state is ConversationState.START:
+            intent = self._detect_intent(user_input_lower)
             if intent == "book":
                 return self._handle_greeting(session)
             elif intent == "cancel":
@@ -172,279 +445,222 @@ class ChatBotService:
                 return self._handle_intent_detection(session)
 
         # Route by state
-        if state == ConversationState.INTENT_DETECTION:
-            return self._handle_intent_detection_response(session, user_input)
-        elif state == ConversationState.GREETING:
-            return self._handle_problem_assessment(session, user_input)
-        elif state == ConversationState.PROBLEM_ASSESSMENT:
-            return self._handle_service_selection(session, user_input)
-        elif state == ConversationState.SERVICE_SELECTION:
-            return self._handle_date_selection(session, user_input)
-        elif state == ConversationState.DATE_SELECTION:
-            return self._handle_time_selection(session, user_input)
-        elif state == ConversationState.TIME_SELECTION:
-            return self._handle_phone_collection(session, user_input)
-        elif state == ConversationState.PHONE_COLLECTION:
-            return self._handle_doctor_selection(session, user_input)
-        elif state == ConversationState.DOCTOR_SELECTION:
-            return self._handle_confirmation(session, user_input)
-        elif state == ConversationState.CONFIRMATION:
-            return self._handle_booking_confirmation(session, user_input)
-        elif state == ConversationState.BOOKING_COMPLETE:
-            return self._handle_followup(session, user_input)
-        # New states for enhanced functionality
-        elif state == ConversationState.CANCEL_START:
-            return self._handle_cancel_appointment_selection(session, user_input)
-        elif state == ConversationState.CANCEL_CONFIRMATION:
-            return self._handle_cancel_confirmation(session, user_input)
-        elif state == ConversationState.RESCHEDULE_START:
-            return self._handle_reschedule_appointment_selection(session, user_input)
-        elif state == ConversationState.RESCHEDULE_APPOINTMENT_SELECTION:
-            return self._handle_reschedule_appointment_selection_response(session, user_input)
-        elif state == ConversationState.RESCHEDULE_DATE_SELECTION:
-            return self._handle_reschedule_date_selection(session, user_input)
-        elif state == ConversationState.RESCHEDULE_TIME_SELECTION:
-            return self._handle_reschedule_time_selection(session, user_input)
-        elif state == ConversationState.RESCHEDULE_CONFIRMATION:
-            return self._handle_reschedule_confirmation(session, user_input)
-        elif state == ConversationState.VIEW_START:
-            return self._handle_view_appointments(session, user_input)
-        elif state == ConversationState.VIEW_RESULTS:
-            return self._handle_view_followup(session, user_input)
-        else:
-            return "I'm not sure what to do. Type 'restart' to begin again."
+        handler = self._handlers.get(state)
+        if handler is None:
+            return _UNKNOWN_STATE_MSG
+        return handler(session, user_input, user_input_lower)
 
-    def _greet_user(self, user_name: str) -> str:
+    def _greet_user(self, user_name: str, hour: Optional[int] = None) -> str:
         """Generate personalized greeting."""
-        hour = datetime.now().hour
-        if hour < 12:
-            greeting = "Good morning"
-        elif hour < 18:
-            greeting = "Good afternoon"
-        else:
-            greeting = "Good evening"
-
-        return (
-            f"{greeting}, {user_name}!\n\n"
-            f"Welcome to DentalClinic Pro - Your appointment assistant.\n"
-            f"I'm here to help you book an appointment quickly and easily.\n"
-            f"(Type 'cancel' anytime to exit)"
+        if hour is None:
+            hour = datetime.now().hour
+        return _GREETING_TEMPLATE.format_map(
+            {"greeting": _greeting_for_hour(hour), "name": user_name}
         )
 
-    def _handle_greeting(self, session: dict) -> str:
+    def _handle_greeting(self, session: Session) -> str:
         """Handle initial greeting."""
-        session["state"] = ConversationState.GREETING
-        return self._greet_user(session["user_name"])
+        session.state = ConversationState.GREETING
+        return self._greet_user(session.user_name, session.now.hour)
 
-    def _handle_problem_assessment(self, session: dict, user_input: str) -> str:
+    def _handle_problem_assessment(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Collect and assess patient's dental problem."""
-        session["data"]["problem"] = user_input
-        session["state"] = ConversationState.PROBLEM_ASSESSMENT
+        session.data.problem = user_input
 
         # Empathetic response based on keywords
-        problem_lower = user_input.lower()
-        if any(w in problem_lower for w in ["emergency", "urgent", "severe", "pain"]):
+        tokens = set(_WORD_RE.findall(user_input_lower))
+        if tokens & _URGENT_WORDS:
             response = "[URGENT] I understand this is urgent! We have emergency slots available.\n\n"
-        elif any(w in problem_lower for w in ["clean", "routine", "checkup"]):
+        elif tokens & _ROUTINE_WORDS:
             response = "[ROUTINE] Great! Routine maintenance is important for healthy teeth.\n\n"
-        elif any(w in problem_lower for w in ["cosmetic", "whiten", "brighten"]):
+        elif tokens & _COSMETIC_WORDS:
             response = "[COSMETIC] We offer cosmetic services! Let's get your smile perfect.\n\n"
         else:
             response = "[INFO] Thank you for sharing that. I'm here to help.\n\n"
 
-        response += "What service would you like?\n"
-        for i, service in enumerate(self.available_services[:6], 1):
-            response += f"  {i}. {service}\n"
-        response += f"  ... ({len(self.available_services)} services available)\n"
-        response += "\nOr type the service name directly:"
+        response += self._SERVICES_MENU_TEXT
 
-        session["state"] = ConversationState.SERVICE_SELECTION
+        session.state = ConversationState.SERVICE_SELECTION
         return response
 
-    def _handle_service_selection(self, session: dict, user_input: str) -> str:
+    def _handle_service_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle service type selection."""
-        user_input_lower = user_input.lower().strip()
-
         # Try to match service
         selected_service = None
 
         # First, try to match by number
         try:
-            service_index = int(user_input.strip()) - 1
-            if 0 <= service_index < len(self.available_services):
-                selected_service = self.available_services[service_index]
+            service_index = int(user_input) - 1
+            if 0 <= service_index < len(self._AVAILABLE_SERVICES):
+                selected_service = self._AVAILABLE_SERVICES[service_index]
         except ValueError:
             pass
 
-        # If not matched by number, try to match by name
+        # If not matched by number, try an exact name, then a partial one
+        if not selected_service:
+            selected_service = self._SERVICE_LOOKUP.get(user_input_lower)
         if not selected_service:
-            for service in ServiceType:
-                if user_input_lower in service.value.lower():
-                    selected_service = service.value
+            for service, service_lower in zip(self._AVAILABLE_SERVICES, self._SERVICES_LOWER):
+                if user_input_lower in service_lower:
+                    selected_service = service
                     break
 
         if not selected_service:
             return (
                 f"[ERROR] I don't recognize '{user_input}'.\n\n"
                 f"Available services:\n"
-                + "\n".join(f"  - {s}" for s in self.available_services)
+                + self._SERVICES_LIST_TEXT
             )
 
-        session["data"]["service_type"] = selected_service
-        session["state"] = ConversationState.DATE_SELECTION
+        session.data.service_type = selected_service
+        session.state = ConversationState.DATE_SELECTION
 
         return (
             f"[OK] Great! You selected: {selected_service}\n\n"
             f"[DATE] When would you like to come in?\n"
             f"Please provide a date (YYYY-MM-DD)\n"
-            f"Example: {(datetime.now() + timedelta(days=5)).strftime('%Y-%m-%d')}"
+            f"Example: {(session.now + timedelta(days=5)).strftime('%Y-%m-%d')}"
         )
 
-    def _handle_date_selection(self, session: dict, user_input: str) -> str:
+    def _handle_date_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle date selection with validation."""
-        is_valid, error_msg = self._is_valid_date(user_input)
+        is_valid, error_msg = self._is_valid_date(user_input, session.now.date())
 
         if not is_valid:
-            if user_input.strip().isdigit():
+            if user_input.isdigit():
                 return f"[ERROR] That looks like a service number. If you meant to select a different service, type 'restart' to start over.\n\n{error_msg}\n\nPlease try again (YYYY-MM-DD)"
             else:
                 return f"[ERROR] {error_msg}\n\nPlease try again (YYYY-MM-DD)"
 
-        session["data"]["date"] = user_input.strip()
-        session["state"] = ConversationState.TIME_SELECTION
+        session.data.date = _canonical_date(user_input)
+        session.state = ConversationState.TIME_SELECTION
 
         return (
-            f"[OK] Date confirmed: {user_input.strip()}\n\n"
+            f"[OK] Date confirmed: {session.data.date}\n\n"
             f"[TIME] What time works for you?\n"
             f"Please provide time in HH:MM format (e.g., 14:30)\n"
             f"Available: 08:00 - 20:00 (30-minute intervals)"
         )
 
-    def _handle_time_selection(self, session: dict, user_input: str) -> str:
+    def _handle_time_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle time selection with validation."""
         is_valid, error_msg = self._is_valid_time(user_input)
         
         if not is_valid:
             return f"[ERROR] {error_msg}\n\nPlease try again (HH:MM)"
 
-        session["data"]["time"] = user_input.strip()
-        session["state"] = ConversationState.PHONE_COLLECTION
+        session.data.time = _canonical_time(user_input)
+        session.state = ConversationState.PHONE_COLLECTION
         
         return (
-            f"[OK] Time confirmed: {user_input.strip()}\n\n"
+            f"[OK] Time confirmed: {session.data.time}\n\n"
             f"[PHONE] What's your phone number?\n"
             f"We need this to confirm your appointment and send reminders."
         )
 
-    def _handle_phone_collection(self, session: dict, user_input: str) -> str:
+    def _handle_phone_collection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle phone number collection and validation."""
         if not self._is_valid_phone(user_input):
-            return "[ERROR] Please provide a valid phone number (7-20 digits)\n\nExample: +1-555-123-4567"
+            return _INVALID_PHONE_MSG
 
-        session["data"]["phone"] = user_input.strip()
-        session["state"] = ConversationState.DOCTOR_SELECTION
+        session.data.phone = user_input
+        session.state = ConversationState.DOCTOR_SELECTION
         
         # Get available doctors
-        doctors = self.clinic.get_all_doctors()
-        
-        if not doctors:
-            doctors_text = "  - Any available doctor (automatic assignment)"
-        else:
-            # Show top 5 doctors
-            doctors_text = "\n".join(
-                f"  - Dr. {d.full_name} ({d.specialty.value}) - Rating: {d.patient_rating}/5"
-                for d in doctors[:5]
-            )
-            if len(doctors) > 5:
-                doctors_text += f"\n  ... and {len(doctors)-5} more doctors"
+        _, doctors_text = self._get_doctors_cached()
 
         return (
-            f"[OK] Phone confirmed: {user_input.strip()}\n\n"
+            f"[OK] Phone confirmed: {user_input}\n\n"
             f"[DOCTOR] Which doctor would you prefer?\n"
             f"{doctors_text}\n\n"
             f"Or type 'any' for next available doctor"
         )
 
-    def _handle_doctor_selection(self, session: dict, user_input: str) -> str:
+    def _get_doctors_cached(self) -> Tuple[list, str]:
+        """Return the doctor list and its rendered menu, refreshed every minute."""
+        now_ts = time.monotonic()
+        cache = self._doctors_cache
+        if cache is None or now_ts - cache[0] >= _DOCTORS_CACHE_TTL_SECONDS:
+            doctors = list(self.clinic.get_all_doctors())
+
+            if not doctors:
+                doctors_text = "  - Any available doctor (automatic assignment)"
+            else:
+                # Show top 5 doctors
+                doctors_text = "\n".join(
+                    f"  - Dr. {d.full_name} ({d.specialty.value})"
+                    for d in doctors[:5]
+                )
+                if len(doctors) > 5:
+                    doctors_text += f"\n  ... and {len(doctors)-5} more doctors"
+
+            cache = self._doctors_cache = (now_ts, doctors, doctors_text)
+        return cache[1], cache[2]
+
+    def _handle_doctor_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle doctor selection."""
-        doctor_input = user_input.strip().lower()
-        
-        if doctor_input == "any":
-            session["data"]["doctor_name"] = "Any"
+        if user_input_lower == "any":
+            session.data.doctor_name = "Any"
         else:
             # Verify doctor exists
             doctor = self.clinic.get_doctor_by_name(user_input)
             if not doctor:
                 return f"[ERROR] Doctor '{user_input}' not found. Please try:\n  - 'any' for automatic assignment\n  - Full doctor name (e.g., 'John Smith')"
-            session["data"]["doctor_name"] = doctor.full_name
+            session.data.doctor_name = doctor.full_name
 
-        session["state"] = ConversationState.CONFIRMATION
+        session.state = ConversationState.CONFIRMATION
         
         # Prepare summary
-        data = session["data"]
+        data = session.data
         summary = (
             f"[REVIEW] Please review your appointment details:\n\n"
-            f"Name: {data['patient_name']}\n"
-            f"Phone: {data['phone']}\n"
-            f"Service: {data['service_type']}\n"
-            f"Date: {data['date']}\n"
-            f"Time: {data['time']}\n"
-            f"Doctor: {data['doctor_name']}\n\n"
+            f"Name: {data.patient_name}\n"
+            f"Phone: {data.phone}\n"
+            f"Service: {data.service_type}\n"
+            f"Date: {data.date}\n"
+            f"Time: {data.time}\n"
+            f"Doctor: {data.doctor_name}\n\n"
             f"Is this correct? (yes/no)"
         )
         
         return summary
 
-    def _handle_confirmation(self, session: dict, user_input: str) -> str:
+    def _handle_confirmation(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle final confirmation before booking."""
-        response_lower = user_input.strip().lower()
-        
-        if response_lower in ["yes", "y", "ok", "correct", "sure"]:
+        if user_input_lower in _YES_WORDS:
             return self._book_appointment(session)
-        elif response_lower in ["no", "n", "cancel", "edit"]:
-            session["state"] = ConversationState.START
-            return "[CANCEL] Appointment cancelled.\n\nType anything to start over."
+        elif user_input_lower in _CONFIRM_NO_WORDS:
+            session.state = ConversationState.START
+            return _BOOKING_CANCELLED_MSG
         else:
-            return "[ERROR] Please answer with 'yes' or 'no'"
+            return _YES_NO_PROMPT_MSG
 
-    def _book_appointment(self, session: dict) -> str:
+    def _book_appointment(self, session: Session) -> str:
         """Create and save appointment to database."""
         try:
-            data = session["data"]
-            
-            # Create appointment object
-            appointment = Appointment(
-                patient_name=data["patient_name"],
-                patient_phone=data["phone"],
-                doctor_name=data["doctor_name"],
-                date=data["date"],
-                time=data["time"],
-                service_type=data["service_type"],
-                status=AppointmentStatus.SCHEDULED,
-                notes=f"Issue: {data['problem']}"
-            )
+            data = session.data
 
-            # Save to database
+            # Save to database; on success message is the new appointment's id
             success, message = self.clinic.book_appointment_validated(
-                patient_name=data["patient_name"],
-                patient_phone=data["phone"],
-                doctor_name=data["doctor_name"],
-                date=data["date"],
-                time=data["time"],
-                service_type=data["service_type"],
-                notes=f"Patient reported: {data['problem']}"
+                patient_name=data.patient_name,
+                patient_phone=data.phone,
+                doctor_name=data.doctor_name,
+                date=data.date,
+                time=data.time,
+                service_type=data.service_type,
+                notes=f"Patient reported: {data.problem}"
             )
 
             if success:
-                session["state"] = ConversationState.BOOKING_COMPLETE
+                session.state = ConversationState.BOOKING_COMPLETE
                 return (
                     f"[SUCCESS] Appointment booked successfully!\n\n"
                     f"Confirmation Details:\n"
-                    f"Appointment ID: {appointment.id}\n"
-                    f"Date: {data['date']} at {data['time']}\n"
-                    f"Doctor: Dr. {data['doctor_name']}\n"
-                    f"Service: {data['service_type']}\n\n"
-                    f"Confirmation sent to {data['phone']}\n"
+                    f"Appointment ID: {message}\n"
+                    f"Date: {data.date} at {data.time}\n"
+                    f"Doctor: Dr. {data.doctor_name}\n"
+                    f"Service: {data.service_type}\n\n"
+                    f"Confirmation sent to {data.phone}\n"
                     f"Please call 30 minutes before your appointment.\n\n"
                     f"Thank you!"
                 )
@@ -454,120 +670,99 @@ class ChatBotService:
         except Exception as e:
             return f"[ERROR] Error booking appointment: {str(e)}\n\nPlease try again later."
 
-    def _handle_followup(self, session: dict, user_input: str) -> str:
+    def _handle_followup(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle post-booking interactions."""
-        if "restart" in user_input.lower():
-            self.sessions[session["user_name"]] = self._create_session(session["user_name"])
-            return "[RESTART] Starting new appointment booking...\n" + self._greet_user(session["user_name"])
-        elif any(w in user_input.lower() for w in ["thank", "thanks", "bye", "goodbye"]):
-            return "[END] You're welcome! Have a great day and take care of your smile!"
+        tokens = set(_WORD_RE.findall(user_input_lower))
+        if "restart" in tokens:
+            now = session.now
+            self.sessions[session.user_name] = self._create_session(session.user_name, now)
+            return "[RESTART] Starting new appointment booking...\n" + self._greet_user(session.user_name, now.hour)
+        elif tokens & _FAREWELL_WORDS:
+            return _FAREWELL_MSG
         else:
-            return (
-                "[INFO] Is there anything else I can help you with?\n"
-                f"Type 'restart' to book another appointment or 'bye' to exit."
-            )
+            return _FOLLOWUP_PROMPT_MSG
 
-    def _detect_intent(self, user_input: str) -> str:
-        """Detect user intent from initial input."""
-        input_lower = user_input.lower().strip()
-
-        # Keywords for different intents
-        book_keywords = ["book", "schedule", "appointment", "make", "new", "create", "set up"]
-        cancel_keywords = ["cancel", "delete", "remove", "stop"]
-        reschedule_keywords = ["reschedule", "change", "modify", "update", "move"]
-        view_keywords = ["view", "see", "show", "list", "check", "my", "upcoming", "appointments"]
-
-        if any(keyword in input_lower for keyword in cancel_keywords):
-            return "cancel"
-        elif any(keyword in input_lower for keyword in reschedule_keywords):
-            return "reschedule"
-        elif any(keyword in input_lower for keyword in view_keywords):
-            return "view"
-        elif any(keyword in input_lower for keyword in book_keywords):
-            return "book"
-        else:
-            return "unknown"
+    def _detect_intent(self, user_input_lower: str) -> str:
+        """
+        Detect user intent from initial (lowercased) input.
 
-    def _handle_intent_detection(self, session: dict) -> str:
+        Keywords match whole words only, so e.g. "mystery" no longer counts
+        as "my" and "removed" no longer counts as "remove".
+        """
+        words = _WORD_RE.findall(user_input_lower)
+        found = {_INTENT_BY_WORD.get(word) for word in words}
+        found.update(_INTENT_BY_PHRASE.get(pair) for pair in zip(words, words[1:]))
+        for intent in _INTENT_PRIORITY:
+            if intent in found:
+                return intent
+        return "unknown"
+
+    def _handle_intent_detection(self, session: Session) -> str:
         """Handle unclear intent by asking user to clarify."""
-        session["state"] = ConversationState.INTENT_DETECTION
-        return (
-            f"Hello! I'm your dental clinic assistant.\n\n"
-            f"What would you like to do?\n\n"
-            f"1. 📅 Book a new appointment\n"
-            f"2. ❌ Cancel an existing appointment\n"
-            f"3. 🔄 Reschedule an appointment\n"
-            f"4. 👀 View my appointments\n\n"
-            f"Please type the number or describe what you need:"
-        )
+        session.state = ConversationState.INTENT_DETECTION
+        return _INTENT_MENU_MSG
 
-    def _handle_intent_detection_response(self, session: dict, user_input: str) -> str:
+    def _handle_intent_detection_response(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle user's response to intent clarification."""
-        input_lower = user_input.lower().strip()
+        choice = _INTENT_CHOICE.get(user_input_lower)
 
-        if input_lower in ["1", "book", "booking", "schedule", "appointment"]:
+        if choice == "book":
             return self._handle_greeting(session)
-        elif input_lower in ["2", "cancel", "cancellation"]:
+        elif choice == "cancel":
             return self._handle_cancel_start(session)
-        elif input_lower in ["3", "reschedule", "change"]:
+        elif choice == "reschedule":
             return self._handle_reschedule_start(session)
-        elif input_lower in ["4", "view", "see", "show"]:
+        elif choice == "view":
             return self._handle_view_start(session)
         else:
-            return (
-                f"[ERROR] I didn't understand that option.\n\n"
-                f"Please choose:\n"
-                f"1. Book appointment\n"
-                f"2. Cancel appointment\n"
-                f"3. Reschedule appointment\n"
-                f"4. View appointments"
-            )
+            return _INTENT_MENU_RETRY_MSG
 
     # ==================== CANCEL APPOINTMENT ====================
 
-    def _handle_cancel_start(self, session: dict) -> str:
+    def _handle_cancel_start(self, session: Session) -> str:
         """Start cancel appointment flow."""
-        session["state"] = ConversationState.CANCEL_START
-        return (
-            f"[CANCEL] Let's cancel your appointment.\n\n"
-            f"Please provide your name or phone number to find your appointments:"
-        )
+        session.state = ConversationState.CANCEL_START
+        return _CANCEL_START_MSG
 
-    def _handle_cancel_appointment_selection(self, session: dict, user_input: str) -> str:
+    def _handle_cancel_appointment_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Find and display appointments for cancellation."""
         # Try to find appointments by name or phone
-        appointments = self.clinic.get_patient_appointments(user_input.strip())
-
-        if not appointments:
-            return (
-                f"[ERROR] No appointments found for '{user_input}'.\n\n"
-                f"Please check your name or phone number and try again."
-            )
-
-        # Filter to show only cancellable appointments (not completed/cancelled)
-        cancellable = [apt for apt in appointments if apt.status in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]]
+        # Only scheduled/confirmed appointments can be cancelled
+        cancellable = self.clinic.get_patient_upcoming_appointments(user_input)
 
         if not cancellable:
+            if not self.clinic.get_patient_appointments(user_input):
+                return (
+                    f"[ERROR] No appointments found for '{user_input}'.\n\n"
+                    f"Please check your name or phone number and try again."
+                )
             return (
                 f"[INFO] You don't have any upcoming appointments that can be cancelled.\n\n"
                 f"All your appointments are either completed or already cancelled."
             )
 
-        session["data"]["available_appointments"] = cancellable
-        session["state"] = ConversationState.CANCEL_CONFIRMATION
+        session.data.available_appointments = cancellable
+        session.state = ConversationState.CANCEL_CONFIRMATION
 
-        response = "[APPOINTMENTS] Here are your upcoming appointments:\n\n"
-        for i, apt in enumerate(cancellable, 1):
-            response += f"{i}. {apt.date} at {apt.time} - Dr. {apt.doctor_name} ({apt.service_type.value})\n"
+        return self._render_appointment_list(
+            cancellable, "Which appointment would you like to cancel? (Enter the number)"
+        )
 
-        response += f"\nWhich appointment would you like to cancel? (Enter the number)"
-        return response
+    def _render_appointment_list(self, appointments: List[Appointment], prompt: str) -> str:
+        """Render a numbered list of upcoming appointments followed by a prompt."""
+        parts = ["[APPOINTMENTS] Here are your upcoming appointments:\n\n"]
+        parts.extend(
+            f"{i}. {apt.date} at {apt.time} - Dr. {apt.doctor_name} ({apt.service_type})\n"
+            for i, apt in enumerate(appointments, 1)
+        )
+        parts.append(f"\n{prompt}")
+        return "".join(parts)
 
-    def _handle_cancel_confirmation(self, session: dict, user_input: str) -> str:
+    def _handle_cancel_confirmation(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle appointment cancellation confirmation."""
         try:
-            appointment_index = int(user_input.strip()) - 1
-            available_appointments = session["data"].get("available_appointments", [])
+            appointment_index = int(user_input) - 1
+            available_appointments = session.data.available_appointments
 
             if appointment_index < 0 or appointment_index >= len(available_appointments):
                 return f"[ERROR] Invalid selection. Please enter a number between 1 and {len(available_appointments)}"
@@ -578,70 +773,61 @@ class ChatBotService:
             success = self.clinic.cancel_appointment(appointment.id, "Cancelled via chatbot")
 
             if success:
-                session["state"] = ConversationState.START
+                session.state = ConversationState.START
                 return (
                     f"[SUCCESS] Appointment cancelled successfully!\n\n"
                     f"Cancelled: {appointment.date} at {appointment.time} with Dr. {appointment.doctor_name}\n\n"
                     f"If you need to book a new appointment, just let me know!"
                 )
             else:
-                return "[ERROR] Failed to cancel appointment. Please try again or contact support."
+                return _CANCEL_FAILED_MSG
 
         except ValueError:
-            return "[ERROR] Please enter a valid number."
+            return _INVALID_NUMBER_MSG
 
     # ==================== RESCHEDULE APPOINTMENT ====================
 
-    def _handle_reschedule_start(self, session: dict) -> str:
+    def _handle_reschedule_start(self, session: Session) -> str:
         """Start reschedule appointment flow."""
-        session["state"] = ConversationState.RESCHEDULE_START
-        return (
-            f"[RESCHEDULE] Let's reschedule your appointment.\n\n"
-            f"Please provide your name or phone number to find your appointments:"
-        )
+        session.state = ConversationState.RESCHEDULE_START
+        return _RESCHEDULE_START_MSG
 
-    def _handle_reschedule_appointment_selection(self, session: dict, user_input: str) -> str:
+    def _handle_reschedule_appointment_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Find and display appointments for rescheduling."""
         # Try to find appointments by name or phone
-        appointments = self.clinic.get_patient_appointments(user_input.strip())
-
-        if not appointments:
-            return (
-                f"[ERROR] No appointments found for '{user_input}'.\n\n"
-                f"Please check your name or phone number and try again."
-            )
-
-        # Filter to show only reschedulable appointments (scheduled/confirmed)
-        reschedulable = [apt for apt in appointments if apt.status in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]]
+        # Only scheduled/confirmed appointments can be rescheduled
+        reschedulable = self.clinic.get_patient_upcoming_appointments(user_input)
 
         if not reschedulable:
+            if not self.clinic.get_patient_appointments(user_input):
+                return (
+                    f"[ERROR] No appointments found for '{user_input}'.\n\n"
+                    f"Please check your name or phone number and try again."
+                )
             return (
                 f"[INFO] You don't have any upcoming appointments that can be rescheduled.\n\n"
                 f"All your appointments are either completed or cancelled."
             )
 
-        session["data"]["available_appointments"] = reschedulable
-        session["state"] = ConversationState.RESCHEDULE_APPOINTMENT_SELECTION
-
-        response = "[APPOINTMENTS] Here are your upcoming appointments:\n\n"
-        for i, apt in enumerate(reschedulable, 1):
-            response += f"{i}. {apt.date} at {apt.time} - Dr. {apt.doctor_name} ({apt.service_type.value})\n"
+        session.data.available_appointments = reschedulable
+        session.state = ConversationState.RESCHEDULE_APPOINTMENT_SELECTION
 
-        response += f"\nWhich appointment would you like to reschedule? (Enter the number)"
-        return response
+        return self._render_appointment_list(
+            reschedulable, "Which appointment would you like to reschedule? (Enter the number)"
+        )
 
-    def _handle_reschedule_appointment_selection_response(self, session: dict, user_input: str) -> str:
+    def _handle_reschedule_appointment_selection_response(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle appointment selection for rescheduling."""
         try:
-            appointment_index = int(user_input.strip()) - 1
-            available_appointments = session["data"].get("available_appointments", [])
+            appointment_index = int(user_input) - 1
+            available_appointments = session.data.available_appointments
 
             if appointment_index < 0 or appointment_index >= len(available_appointments):
                 return f"[ERROR] Invalid selection. Please enter a number between 1 and {len(available_appointments)}"
 
             appointment = available_appointments[appointment_index]
-            session["data"]["selected_appointment"] = appointment
-            session["state"] = ConversationState.RESCHEDULE_DATE_SELECTION
+            session.data.selected_appointment = appointment
+            session.state = ConversationState.RESCHEDULE_DATE_SELECTION
 
             return (
                 f"[OK] Selected appointment: {appointment.date} at {appointment.time} with Dr. {appointment.doctor_name}\n\n"
@@ -650,38 +836,38 @@ class ChatBotService:
             )
 
         except ValueError:
-            return "[ERROR] Please enter a valid number."
+            return _INVALID_NUMBER_MSG
 
-    def _handle_reschedule_date_selection(self, session: dict, user_input: str) -> str:
+    def _handle_reschedule_date_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle new date selection for rescheduling."""
-        is_valid, error_msg = self._is_valid_date(user_input)
+        is_valid, error_msg = self._is_valid_date(user_input, session.now.date())
 
         if not is_valid:
             return f"[ERROR] {error_msg}\n\nPlease try again (YYYY-MM-DD)"
 
-        session["data"]["new_date"] = user_input.strip()
-        session["state"] = ConversationState.RESCHEDULE_TIME_SELECTION
+        session.data.new_date = _canonical_date(user_input)
+        session.state = ConversationState.RESCHEDULE_TIME_SELECTION
 
         return (
-            f"[OK] New date confirmed: {user_input.strip()}\n\n"
+            f"[OK] New date confirmed: {session.data.new_date}\n\n"
             f"[NEW TIME] What time works for you?\n"
             f"Please provide time in HH:MM format (e.g., 14:30)\n"
             f"Available: 08:00 - 20:00 (30-minute intervals)"
         )
 
-    def _handle_reschedule_time_selection(self, session: dict, user_input: str) -> str:
+    def _handle_reschedule_time_selection(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle new time selection for rescheduling."""
         is_valid, error_msg = self._is_valid_time(user_input)
 
         if not is_valid:
             return f"[ERROR] {error_msg}\n\nPlease try again (HH:MM)"
 
-        session["data"]["new_time"] = user_input.strip()
-        session["state"] = ConversationState.RESCHEDULE_CONFIRMATION
+        session.data.new_time = _canonical_time(user_input)
+        session.state = ConversationState.RESCHEDULE_CONFIRMATION
 
-        appointment = session["data"]["selected_appointment"]
-        new_date = session["data"]["new_date"]
-        new_time = session["data"]["new_time"]
+        appointment = session.data.selected_appointment
+        new_date = session.data.new_date
+        new_time = session.data.new_time
 
         return (
             f"[REVIEW] Please confirm the rescheduling:\n\n"
@@ -690,96 +876,75 @@ class ChatBotService:
             f"Is this correct? (yes/no)"
         )
 
-    def _handle_reschedule_confirmation(self, session: dict, user_input: str) -> str:
+    def _handle_reschedule_confirmation(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle rescheduling confirmation."""
-        response_lower = user_input.strip().lower()
-
-        if response_lower in ["yes", "y", "ok", "correct", "sure"]:
-            appointment = session["data"]["selected_appointment"]
-            new_date = session["data"]["new_date"]
-            new_time = session["data"]["new_time"]
+        if user_input_lower in _YES_WORDS:
+            appointment = session.data.selected_appointment
+            new_date = session.data.new_date
+            new_time = session.data.new_time
 
             success = self.clinic.reschedule_appointment(appointment.id, new_date, new_time)
 
             if success:
-                session["state"] = ConversationState.START
+                session.state = ConversationState.START
                 return (
                     f"[SUCCESS] Appointment rescheduled successfully!\n\n"
                     f"New appointment: {new_date} at {new_time} with Dr. {appointment.doctor_name}\n"
-                    f"Service: {appointment.service_type.value}\n\n"
+                    f"Service: {appointment.service_type}\n\n"
                     f"Thank you!"
                 )
             else:
-                return "[ERROR] Failed to reschedule appointment. Please try again or contact support."
-        elif response_lower in ["no", "n", "cancel"]:
-            session["state"] = ConversationState.START
-            return "[CANCEL] Rescheduling cancelled.\n\nType anything to start over."
+                return _RESCHEDULE_FAILED_MSG
+        elif user_input_lower in _NO_WORDS:
+            session.state = ConversationState.START
+            return _RESCHEDULE_CANCELLED_MSG
         else:
-            return "[ERROR] Please answer with 'yes' or 'no'"
+            return _YES_NO_PROMPT_MSG
 
     # ==================== VIEW APPOINTMENTS ====================
 
-    def _handle_view_start(self, session: dict) -> str:
+    def _handle_view_start(self, session: Session) -> str:
         """Start view appointments flow."""
-        session["state"] = ConversationState.VIEW_START
-        return (
-            f"[VIEW] Let's check your appointments.\n\n"
-            f"Please provide your name or phone number:"
-        )
+        session.state = ConversationState.VIEW_START
+        return _VIEW_START_MSG
 
-    def _handle_view_appointments(self, session: dict, user_input: str) -> str:
+    def _handle_view_appointments(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Display user's appointments."""
-        appointments = self.clinic.get_patient_appointments(user_input.strip())
+        appointments = self.clinic.get_patient_appointments(user_input)
 
         if not appointments:
-            session["state"] = ConversationState.START
+            session.state = ConversationState.START
             return (
                 f"[INFO] No appointments found for '{user_input}'.\n\n"
                 f"If you'd like to book an appointment, just let me know!"
             )
 
-        session["state"] = ConversationState.VIEW_RESULTS
+        session.state = ConversationState.VIEW_RESULTS
 
-        response = f"[APPOINTMENTS] Here are your appointments:\n\n"
-
-        # Sort appointments by date
-        appointments.sort(key=lambda x: x.get_datetime())
+        # Already in date order from the clinic service
+        parts = ["[APPOINTMENTS] Here are your appointments:\n\n"]
 
         for apt in appointments:
-            status_emoji = {
-                AppointmentStatus.SCHEDULED: "📅",
-                AppointmentStatus.CONFIRMED: "✅",
-                AppointmentStatus.COMPLETED: "✔️",
-                AppointmentStatus.CANCELLED: "❌",
-                AppointmentStatus.NO_SHOW: "🚫",
-                AppointmentStatus.RESCHEDULED: "🔄"
-            }.get(apt.status, "❓")
-
-            response += f"{status_emoji} {apt.date} at {apt.time} - Dr. {apt.doctor_name}\n"
-            response += f"   Service: {apt.service_type.value} | Status: {apt.status.value}\n"
+            status_emoji = _STATUS_EMOJI.get(apt.status, "❓")
+
+            parts.append(f"{status_emoji} {apt.date} at {apt.time} - Dr. {apt.doctor_name}\n")
+            parts.append(f"   Service: {apt.service_type} | Status: {apt.status}\n")
 
             if apt.notes:
-                response += f"   Notes: {apt.notes}\n"
-            response += "\n"
+                parts.append(f"   Notes: {apt.notes}\n")
+            parts.append("\n")
 
-        response += "Would you like to book a new appointment, cancel, or reschedule any of these? (book/cancel/reschedule/no)"
-        return response
+        parts.append("Would you like to book a new appointment, cancel, or reschedule any of these? (book/cancel/reschedule/no)")
+        return "".join(parts)
 
-    def _handle_view_followup(self, session: dict, user_input: str) -> str:
+    def _handle_view_followup(self, session: Session, user_input: str, user_input_lower: str) -> str:
         """Handle follow-up after viewing appointments."""
-        input_lower = user_input.lower().strip()
-
-        if input_lower in ["book", "booking", "new", "schedule"]:
-            return self._handle_greeting(session)
-        elif input_lower in ["cancel", "cancellation"]:
-            return self._handle_cancel_start(session)
-        elif input_lower in ["reschedule", "change"]:
-            return self._handle_reschedule_start(session)
-        elif input_lower in ["no", "nothing", "thanks", "bye"]:
-            session["state"] = ConversationState.START
-            return "[END] You're welcome! Have a great day and take care of your smile!"
-        else:
-            return (
-                "[INFO] What would you like to do next?\n"
-                f"Type 'book' for new appointment, 'cancel' to cancel, 'reschedule' to change, or 'no' to exit."
-            )
+        handler = self._view_followup_handlers.get(user_input_lower)
+        if handler is None:
+            return _VIEW_FOLLOWUP_PROMPT_MSG
+        return handler(session)
+
+    def _handle_view_exit(self, session: Session) -> str:
+        """End the conversation after viewing appointments."""
+        session.state = ConversationState.START
+        return _FAREWELL_MSG
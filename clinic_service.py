@@ -1,21 +1,67 @@
 # src/services/clinic_service.py
-from typing import List, Optional
+from bisect import insort
+from operator import methodcaller
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.models.appointment import Appointment, AppointmentStatus, ACTIVE_STATUSES
 from src.models.doctor import Doctor, MedicalSpecialty
 from src.models.patient import Patient
 
+_APPOINTMENT_TIME = methodcaller("get_datetime")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name and collapse its whitespace for lookups."""
+    return " ".join(name.lower().split())
+
+
 class ClinicService:
     """Service layer for Dental Clinic Management."""
 
     def __init__(self):
         self._doctors: List[Doctor] = []
         self._patients: List[Patient] = []
+        self._appointments: List[Appointment] = []
+        self._appointments_by_id: Dict[str, Appointment] = {}
+        # Duplicate checks and exact lookups
+        self._doctors_by_id: Dict[str, Doctor] = {}
+        self._doctors_by_license: Dict[str, Doctor] = {}
+        self._doctors_by_name: Dict[str, Doctor] = {}
+        self._patients_by_id: Dict[str, Patient] = {}
+        self._patients_by_key: Dict[Tuple[str, int], Patient] = {}
+        # Lowercased searchable field value -> positions in _doctors/_patients
+        self._doctor_search_index: Dict[str, List[int]] = {}
+        self._patient_search_index: Dict[str, List[int]] = {}
+        # Patient name and phone -> that patient's appointments, kept in date order
+        self._appointments_by_patient: Dict[str, List[Appointment]] = {}
+
+    @staticmethod
+    def _index_fields(index: Dict[str, List[int]], position: int, *values: str) -> None:
+        """Record position under each lowercased value."""
+        for value in {v.lower() for v in values if v}:
+            index.setdefault(value, []).append(position)
+
+    @staticmethod
+    def _search(index: Dict[str, List[int]], records: list, term: str) -> list:
+        """Return records (in insertion order) with any indexed value containing term."""
+        positions = set()
+        for value, value_positions in index.items():
+            if term in value:
+                positions.update(value_positions)
+        return [records[i] for i in sorted(positions)]
 
     # -------- Doctor Methods --------
     def add_doctor(self, doctor: Doctor) -> bool:
         """Add a new doctor if license number is unique."""
-        if any(d.license_number == doctor.license_number for d in self._doctors):
+        if doctor.license_number in self._doctors_by_license:
             return False  # Duplicate license
+        self._index_fields(
+            self._doctor_search_index, len(self._doctors),
+            doctor.first_name, doctor.last_name, doctor.license_number,
+        )
         self._doctors.append(doctor)
+        self._doctors_by_id[doctor.id] = doctor
+        self._doctors_by_license[doctor.license_number] = doctor
+        self._doctors_by_name.setdefault(normalize_name(doctor.full_name), doctor)
         return True
 
     def get_all_doctors(self) -> List[Doctor]:
@@ -24,33 +70,105 @@ class ClinicService:
 
     def find_doctor(self, search_term: str) -> List[Doctor]:
         """Find doctors by name or license."""
-        term = search_term.lower()
-        return [
-            d for d in self._doctors
-            if term in d.first_name.lower() or term in d.last_name.lower() or term in d.license_number.lower()
-        ]
+        return self._search(self._doctor_search_index, self._doctors, search_term.lower())
+
+    def get_doctor_by_id(self, doctor_id: str) -> Optional[Doctor]:
+        """Return the doctor with this id, if any."""
+        return self._doctors_by_id.get(doctor_id)
+
+    def get_doctor_by_name(self, full_name: str) -> Optional[Doctor]:
+        """Return the doctor with this full name (case-insensitive), if any."""
+        return self._doctors_by_name.get(normalize_name(full_name))
 
     # -------- Patient Methods --------
     def add_patient(self, patient: Patient) -> bool:
         """Add a new patient."""
-        if any(p.full_name == patient.full_name and p.age == patient.age for p in self._patients):
+        key = (patient.full_name, patient.age)
+        if key in self._patients_by_key:
             return False  # Duplicate patient
+        self._index_fields(
+            self._patient_search_index, len(self._patients),
+            patient.first_name, patient.last_name, patient.phone,
+        )
         self._patients.append(patient)
+        self._patients_by_id[patient.id] = patient
+        self._patients_by_key[key] = patient
         return True
 
     def get_all_patients(self) -> List[Patient]:
         """Return all patients."""
         return self._patients
 
+    def get_patient_by_id(self, patient_id: str) -> Optional[Patient]:
+        """Return the patient with this id, if any."""
+        return self._patients_by_id.get(patient_id)
+
     def find_patient(self, search_term: str) -> List[Patient]:
         """Find patients by name or phone."""
-        term = search_term.lower()
-        return [
-            p for p in self._patients
-            if term in p.first_name.lower() 
-            or term in p.last_name.lower() 
-            or term in (p.phone.lower() if p.phone else "")
-        ]
+        return self._search(self._patient_search_index, self._patients, search_term.lower())
+
+    # -------- Appointment Methods --------
+    def add_appointment(self, appointment: Appointment) -> None:
+        """Add a new appointment."""
+        self._appointments.append(appointment)
+        self._appointments_by_id[appointment.id] = appointment
+        for key in {appointment.patient_name, appointment.patient_phone}:
+            insort(self._appointments_by_patient.setdefault(key, []), appointment, key=_APPOINTMENT_TIME)
+
+    def book_appointment_validated(
+        self, patient_name: str, patient_phone: str, doctor_name: str,
+        date: str, time: str, service_type: str, notes: Optional[str] = None,
+    ) -> Tuple[bool, str]:
+        """Validate and add a new appointment. Returns (True, appointment id) or (False, error)."""
+        try:
+            appointment = Appointment(
+                patient_name=patient_name, patient_phone=patient_phone, doctor_name=doctor_name,
+                date=date, time=time, service_type=service_type, notes=notes,
+            )
+        except ValueError as e:
+            return False, str(e)
+        self.add_appointment(appointment)
+        return True, appointment.id
+
+    def cancel_appointment(self, appointment_id: str, reason: str = "No reason provided") -> bool:
+        """Cancel an appointment. Returns False if not found or it can no longer be cancelled."""
+        appointment = self._appointments_by_id.get(appointment_id)
+        if appointment is None:
+            return False
+        appointment.cancel(reason)
+        return appointment.status == AppointmentStatus.CANCELLED
+
+    def reschedule_appointment(self, appointment_id: str, new_date: str, new_time: str) -> bool:
+        """Move an appointment to a new date and time. Returns False if not found or invalid."""
+        appointment = self._appointments_by_id.get(appointment_id)
+        if appointment is None:
+            return False
+        try:
+            Appointment.validate_date(new_date)
+            Appointment.validate_time(new_time)
+        except ValueError:
+            return False
+
+        # Take it out of the per-patient lists before its sort key changes
+        keys = {appointment.patient_name, appointment.patient_phone}
+        for key in keys:
+            bucket = self._appointments_by_patient[key]
+            del bucket[next(i for i, a in enumerate(bucket) if a is appointment)]
+        appointment.date = new_date
+        appointment.time = new_time
+        for key in keys:
+            insort(self._appointments_by_patient[key], appointment, key=_APPOINTMENT_TIME)
+        return True
+
+    def get_patient_appointments(self, query: str) -> List[Appointment]:
+        """Return a patient's appointments (by name or phone), earliest first."""
+        return list(self._appointments_by_patient.get(query, ()))
+
+    def get_patient_upcoming_appointments(
+        self, query: str, statuses: Iterable[str] = ACTIVE_STATUSES
+    ) -> List[Appointment]:
+        """Return a patient's appointments (by name or phone) whose status is in statuses."""
+        return [a for a in self._appointments_by_patient.get(query, ()) if a.status in statuses]
 
     # -------- Clinic Stats --------
     def get_clinic_stats(self) -> dict:
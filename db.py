@@ -1,5 +1,13 @@
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo.errors import ConnectionFailure, PyMongoError
+from importlib.util import find_spec
+
+# Wire compressors in order of preference; zstd/snappy need their optional
+# packages, so only ask for the ones installed here (zlib is always there).
+_COMPRESSORS = ",".join(
+    name for name, module in (("zstd", "zstandard"), ("snappy", "snappy"), ("zlib", "zlib"))
+    if find_spec(module) is not None
+)
 
 class Database:
     """
@@ -13,18 +21,57 @@ class Database:
     def connect(cls, uri="mongodb://localhost:27017/", db_name="DentalClinicDB"):
         if cls._client is None:
             try:
-                cls._client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+                # A CLI/chatbot process needs only a handful of connections
+                cls._client = MongoClient(
+                    uri,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=10,
+                    minPoolSize=1,
+                    maxIdleTimeMS=60000,
+                    compressors=_COMPRESSORS,
+                    retryWrites=True,
+                )
                 # Verify connection
                 cls._client.admin.command('ping')
                 cls._db = cls._client[db_name]
                 print(f"[OK] [DB] Connected to MongoDB: {db_name}")
+                cls._ensure_indexes()
             except ConnectionFailure:
                 print("[FAIL] [DB] Failed to connect. Is MongoDB running?")
                 cls._client = None
         return cls._db
 
+    @classmethod
+    def _ensure_indexes(cls):
+        """
+        Create indexes for the fields the clinic looks records up by.
+        create_index is a no-op when the index already exists.
+        """
+        try:
+            cls._db.doctors.create_index("license_number", unique=True)
+            cls._db.patients.create_index([("first_name", 1), ("last_name", 1), ("age", 1)], unique=True)
+            cls._db.patients.create_index("phone")
+            cls._db.appointments.create_index("patient_name")
+            cls._db.appointments.create_index("patient_phone")
+            cls._db.appointments.create_index([("date", 1), ("time", 1)])
+        except PyMongoError as e:
+            print(f"[WARN] [DB] Could not create indexes: {e}")
+
     @classmethod
     def get_db(cls):
         if cls._db is None:
             return cls.connect()
         return cls._db
+
+    @classmethod
+    def batch_get(cls, collection_name, ids):
+        """
+        Fetch every document whose _id is in ids with a single query,
+        instead of one find_one round-trip per id.
+        """
+        ids = list(ids)
+        db = cls.get_db()
+        if db is None or not ids:
+            return []
+        cursor = db[collection_name].find({"_id": {"$in": ids}}, batch_size=len(ids))
+        return list(cursor)
@@ -13,3 +13,10 @@ class MedicalSpecialty(Enum):
 class Doctor(Person):
     license_number: str
     specialty: MedicalSpecialty
+
+    @classmethod
+    def from_trusted_dict(cls, raw: dict) -> "Doctor":
+        """model_construct keeps raw values, so restore the specialty Enum."""
+        doctor = cls.model_construct(**raw)
+        doctor.specialty = MedicalSpecialty(doctor.specialty)
+        return doctor
@@ -54,9 +54,32 @@ class Person(ABC):
 
 # ===== Clinic CLI =====
 class ClinicCLI:
+    _MENU_STR = (
+        "\n" + "=" * 50 + "\n"
+        " DENTAL CLINIC MANAGER V2 \n"
+        + "=" * 50 + "\n"
+        "1. Add New Doctor\n"
+        "2. Register New Patient\n"
+        "3. List All Doctors\n"
+        "4. List All Patients\n"
+        "5. Search Patient\n"
+        "6. AI Assistant (Chat)\n"
+        "7. Clinic Statistics\n"
+        "8. Exit"
+    )
+
     def __init__(self):
         self.clinic = ClinicService()
         self.bot = ChatBotService()
+        self._options = {
+            "1": self.add_doctor_cli,
+            "2": self.register_patient_cli,
+            "3": self.list_doctors_cli,
+            "4": self.list_patients_cli,
+            "5": self.search_patient_cli,
+            "6": self.ai_chat_cli,
+            "7": self.clinic_stats_cli
+        }
 
     # ----- Doctor Methods -----
     def add_doctor_cli(self):
@@ -150,18 +173,16 @@ class ClinicCLI:
         if not doctors:
             print("📭 No doctors found.")
         else:
-            print("\n--- DOCTORS LIST ---")
-            for i, d in enumerate(doctors, 1):
-                print(f"{i}. Dr. {d.full_name} | {d.specialty.value} | {d.phone}")
+            lines = (f"{i}. Dr. {d.full_name} | {d.specialty.value} | {d.phone}" for i, d in enumerate(doctors, 1))
+            sys.stdout.write("\n--- DOCTORS LIST ---\n" + "\n".join(lines) + "\n")
 
     def list_patients_cli(self):
         patients = self.clinic.get_all_patients()
         if not patients:
             print("📭 No patients found.")
         else:
-            print("\n--- PATIENTS LIST ---")
-            for i, p in enumerate(patients, 1):
-                print(f"{i}. {p.full_name} | Age: {p.age} | {p.phone}")
+            lines = (f"{i}. {p.full_name} | Age: {p.age} | {p.phone}" for i, p in enumerate(patients, 1))
+            sys.stdout.write("\n--- PATIENTS LIST ---\n" + "\n".join(lines) + "\n")
 
     # ----- Search Methods -----
     def search_patient_cli(self):
@@ -170,9 +191,8 @@ class ClinicCLI:
         if not results:
             print("❌ No match found.")
         else:
-            print(f"✔️ Found {len(results)} result(s):")
-            for p in results:
-                print(f"• {p.full_name} | Phone: {p.phone}")
+            lines = (f"• {p.full_name} | Phone: {p.phone}" for p in results)
+            sys.stdout.write(f"✔️ Found {len(results)} result(s):\n" + "\n".join(lines) + "\n")
 
     # ----- AI Chat -----
     def ai_chat_cli(self):
@@ -195,35 +215,16 @@ class ClinicCLI:
     # ===== Main Loop =====
     def run(self):
         while True:
-            print("\n" + "=" * 50)
-            print(" DENTAL CLINIC MANAGER V2 ")
-            print("=" * 50)
-            print("1. Add New Doctor")
-            print("2. Register New Patient")
-            print("3. List All Doctors")
-            print("4. List All Patients")
-            print("5. Search Patient")
-            print("6. AI Assistant (Chat)")
-            print("7. Clinic Statistics")
-            print("8. Exit")
+            print(self._MENU_STR)
             choice = input("\nSelect Option (1-8): ").strip()
 
-            options = {
-                "1": self.add_doctor_cli,
-                "2": self.register_patient_cli,
-                "3": self.list_doctors_cli,
-                "4": self.list_patients_cli,
-                "5": self.search_patient_cli,
-                "6": self.ai_chat_cli,
-                "7": self.clinic_stats_cli
-            }
-
+            handler = self._options.get(choice)
             if choice == "8":
                 print("👋 Goodbye!")
                 break
-            elif choice in options:
+            elif handler:
                 try:
-                    options[choice]()
+                    handler()
                 except Exception as e:
                     logging.error(f"Error executing option {choice}: {e}")
             else:
@@ -20,4 +20,13 @@ class Patient(Person):
     gender: Gender  # Uses the Enum
     blood_type: Optional[str] = None
     medical_history: List[str] = [] 
-    emergency_contact: Optional[EmergencyContact] = None
\ No newline at end of file
+    emergency_contact: Optional[EmergencyContact] = None
+
+    @classmethod
+    def from_trusted_dict(cls, raw: dict) -> "Patient":
+        """model_construct keeps raw values, so restore the Enum and nested contact."""
+        patient = cls.model_construct(**raw)
+        patient.gender = Gender(patient.gender)
+        if isinstance(patient.emergency_contact, dict):
+            patient.emergency_contact = EmergencyContact.from_trusted_dict(patient.emergency_contact)
+        return patient
\ No newline at end of file
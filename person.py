@@ -1,19 +1,32 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
-import uuid
+from secrets import token_hex
 
 class Person(BaseModel):
     """
     Base Person class for Doctor/Patient inheritance.
     """
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:8], alias="_id")
+    id: str = Field(default_factory=lambda: token_hex(4), alias="_id")
     first_name: str
     last_name: str
     phone: str
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        """Cheap shape check; full EmailStr validation is not needed here."""
+        if v is not None and ("@" not in v or "." not in v):
+            raise ValueError('Invalid email format')
+        return v
+
+    @classmethod
+    def from_trusted_dict(cls, raw: dict):
+        """Build from an already-validated document (e.g. a DB read) without revalidating."""
+        return cls.model_construct(**raw)
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
@@ -11,10 +11,10 @@ Features:
 - Timestamp tracking
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 from datetime import datetime
-import uuid
+from secrets import token_hex
 
 
 class Review(BaseModel):
@@ -31,7 +31,7 @@ class Review(BaseModel):
         created_at: When review was posted
         helpful_count: Number of times marked as helpful
     """
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:8], alias="_id")
+    id: str = Field(default_factory=lambda: token_hex(4), alias="_id")
     patient_name: str = Field(..., min_length=1, max_length=100)
     doctor_name: str = Field(..., min_length=1, max_length=100)
     rating: int = Field(..., ge=1, le=5)
@@ -40,10 +40,7 @@ class Review(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     helpful_count: int = Field(default=0, ge=0)
 
-    class Config:
-        """Pydantic configuration."""
-        populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(populate_by_name=True)
 
     @field_validator('rating')
     @classmethod
@@ -62,6 +59,11 @@ class Review(BaseModel):
         # Remove extra whitespace
         return v.strip()
 
+    @classmethod
+    def from_trusted_dict(cls, raw: dict) -> "Review":
+        """Build a review from an already-validated document (e.g. a DB read)."""
+        return cls.model_construct(**raw)
+
     def __str__(self) -> str:
         """String representation."""
         stars = "⭐" * self.rating